@@ -9,30 +9,61 @@ from .core import (
     ToolResult,
 )
 
+# Eager: the `registry` instance must shadow the `agten.registry` submodule.
 from .registry import AgentRegistry, registry
-from .communication import MessageBus, CommunicationProtocol, ConversationState
-from .tools import ToolExecutor, BashTool, FileReadTool, FileWriteTool, ToolConfig
-from .lifecycle import AgentManager, AgentOrchestrator, LifecycleEvent, LifecycleState
-from .config import (
-    ConfigManager,
-    FrameworkConfig,
-    AgentConfig,
-    ToolConfig as ToolConfigClass,
-)
-from .reasoning import (
-    ReasoningAgent,
-    AdvancedReasoningAgent,
-    ReasoningEngine,
-    CoTReasoningEngine,
-    Thought,
-    Plan,
-    ReasoningStep,
-    CalculatorTool,
-    SearchTool,
-    WeatherTool,
-    FileAnalysisTool,
-    CodeExecutionTool,
-)
+
+import importlib
+from typing import Any, Dict, Tuple
+
+# Everything outside core is imported on first access (PEP 562), so e.g.
+# `from agten.core import Agent` doesn't pay for YAML, orjson, watchfiles
+# and the reasoning package.
+_LAZY: Dict[str, Tuple[str, str]] = {
+    "MessageBus": (".communication", "MessageBus"),
+    "CommunicationProtocol": (".communication", "CommunicationProtocol"),
+    "ConversationState": (".communication", "ConversationState"),
+    "ToolExecutor": (".tools", "ToolExecutor"),
+    "BashTool": (".tools", "BashTool"),
+    "FileReadTool": (".tools", "FileReadTool"),
+    "FileWriteTool": (".tools", "FileWriteTool"),
+    "ToolConfig": (".tools", "ToolConfig"),
+    "AgentManager": (".lifecycle", "AgentManager"),
+    "AgentOrchestrator": (".lifecycle", "AgentOrchestrator"),
+    "LifecycleEvent": (".lifecycle", "LifecycleEvent"),
+    "LifecycleState": (".lifecycle", "LifecycleState"),
+    "ConfigManager": (".config", "ConfigManager"),
+    "FrameworkConfig": (".config", "FrameworkConfig"),
+    "AgentConfig": (".config", "AgentConfig"),
+    "ToolConfigClass": (".config", "ToolConfig"),
+    "ReasoningAgent": (".reasoning", "ReasoningAgent"),
+    "AdvancedReasoningAgent": (".reasoning", "AdvancedReasoningAgent"),
+    "ReasoningEngine": (".reasoning", "ReasoningEngine"),
+    "CoTReasoningEngine": (".reasoning", "CoTReasoningEngine"),
+    "Thought": (".reasoning", "Thought"),
+    "Plan": (".reasoning", "Plan"),
+    "ReasoningStep": (".reasoning", "ReasoningStep"),
+    "CalculatorTool": (".reasoning", "CalculatorTool"),
+    "SearchTool": (".reasoning", "SearchTool"),
+    "WeatherTool": (".reasoning", "WeatherTool"),
+    "FileAnalysisTool": (".reasoning", "FileAnalysisTool"),
+    "CodeExecutionTool": (".reasoning", "CodeExecutionTool"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY.keys())
+
 
 __version__ = "0.1.0"
 __all__ = [
@@ -1,40 +1,50 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+from collections import defaultdict, deque
 from dataclasses import dataclass
 import asyncio
 import logging
 from datetime import datetime
 
-from .core import Agent, Message, MessageType, AgentStatus, AgentContext
+from .core import Agent, Message, MessageType, AgentStatus, AgentContext, _IdPool
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationState:
-    messages: List[Message] = None
+    messages: Deque[Message] = None
     current_agent: Optional[str] = None
     metadata: Dict[str, Any] = None
+    last_message: Optional[Message] = None
 
     def __post_init__(self):
         if self.messages is None:
-            self.messages = []
+            self.messages = deque()
         if self.metadata is None:
             self.metadata = {}
 
 
 class MessageBus:
-    def __init__(self):
-        self._subscribers: Dict[str, List[Agent]] = {}
+    def __init__(self, max_conversation_length: int = 1000):
+        self.max_conversation_length = max_conversation_length
+        self._subscribers: Dict[str, Set[Agent]] = {}
         self._conversations: Dict[str, ConversationState] = {}
-        self._global_subscribers: List[Agent] = []
+        self._global_subscribers: Set[Agent] = set()
+        self._agents_by_id: Dict[str, Agent] = {}
+        # Recipients for undirected messages, keyed by topic (None = global
+        # only). Rebuilt on subscribe/unsubscribe so publish never copies.
+        self._effective: Dict[Optional[str], Tuple[Agent, ...]] = {None: ()}
 
     def subscribe(self, agent: Agent, topic: Optional[str] = None) -> None:
         if topic:
             if topic not in self._subscribers:
-                self._subscribers[topic] = []
-            self._subscribers[topic].append(agent)
+                self._subscribers[topic] = set()
+            self._subscribers[topic].add(agent)
         else:
-            self._global_subscribers.append(agent)
+            self._global_subscribers.add(agent)
+
+        self._agents_by_id[agent.id] = agent
+        self._refresh_effective(topic)
 
         logger.info(
             f"Agent {agent.name} subscribed to {'global' if not topic else topic}"
@@ -42,48 +52,92 @@ class MessageBus:
 
     def unsubscribe(self, agent: Agent, topic: Optional[str] = None) -> None:
         if topic and topic in self._subscribers:
-            self._subscribers[topic].remove(agent)
+            self._subscribers[topic].discard(agent)
+            self._refresh_effective(topic)
         else:
-            if agent in self._global_subscribers:
-                self._global_subscribers.remove(agent)
+            self._global_subscribers.discard(agent)
+            self._refresh_effective()
+
+        if not self._is_subscribed(agent):
+            self._agents_by_id.pop(agent.id, None)
 
         logger.info(
             f"Agent {agent.name} unsubscribed from {'global' if not topic else topic}"
         )
 
-    async def publish(self, message: Message, topic: Optional[str] = None) -> None:
-        recipients = []
+    def _refresh_effective(self, topic: Optional[str] = None) -> None:
+        if topic:
+            self._effective[topic] = tuple(
+                self._subscribers[topic] | self._global_subscribers
+            )
+            return
 
-        if topic and topic in self._subscribers:
-            recipients.extend(self._subscribers[topic])
+        self._effective = {None: tuple(self._global_subscribers)}
+        for name, agents in self._subscribers.items():
+            self._effective[name] = tuple(agents | self._global_subscribers)
 
-        recipients.extend(self._global_subscribers)
+    def _is_subscribed(self, agent: Agent) -> bool:
+        if agent in self._global_subscribers:
+            return True
+        return any(agent in agents for agents in self._subscribers.values())
 
+    def _resolve_recipients(
+        self, message: Message, topic: Optional[str] = None
+    ) -> Sequence[Agent]:
         if message.recipient:
-            recipients = [
-                agent for agent in recipients if agent.id == message.recipient
-            ]
+            # Direct messages go straight to the addressed agent without
+            # walking the topic/global subscriber lists.
+            agent = self._agents_by_id.get(message.recipient)
+            return (agent,) if agent is not None else ()
 
-        tasks = []
-        for agent in recipients:
-            task = asyncio.create_task(agent.send_message(message))
-            tasks.append(task)
+        return self._effective.get(topic, self._effective[None])
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+    async def publish(self, message: Message, topic: Optional[str] = None) -> None:
+        recipients = self._resolve_recipients(message, topic)
+
+        if len(recipients) == 1:
+            try:
+                await recipients[0].send_message(message)
+            except Exception as e:
+                logger.error(f"Failed to deliver message to {recipients[0].name}: {e}")
+        elif recipients:
+            await asyncio.gather(
+                *(agent.send_message(message) for agent in recipients),
+                return_exceptions=True,
+            )
 
         self._update_conversation(message)
 
+    async def publish_batch(
+        self, messages: List[Message], topic: Optional[str] = None
+    ) -> None:
+        batches: Dict[Agent, List[Message]] = defaultdict(list)
+        for message in messages:
+            for agent in self._resolve_recipients(message, topic):
+                batches[agent].append(message)
+
+        if batches:
+            await asyncio.gather(
+                *(agent.send_messages(batch) for agent, batch in batches.items()),
+                return_exceptions=True,
+            )
+
+        for message in messages:
+            self._update_conversation(message)
+
     def _update_conversation(self, message: Message) -> None:
         conversation_id = message.metadata.get("conversation_id")
         if not conversation_id:
             return
 
-        if conversation_id not in self._conversations:
-            self._conversations[conversation_id] = ConversationState()
+        state = self._conversations.get(conversation_id)
+        if state is None:
+            state = self._conversations[conversation_id] = ConversationState(
+                messages=deque(maxlen=self.max_conversation_length)
+            )
 
-        state = self._conversations[conversation_id]
         state.messages.append(message)
+        state.last_message = message
 
         if message.sender:
             state.current_agent = message.sender
@@ -93,7 +147,7 @@ class MessageBus:
 
     def get_conversation_history(self, conversation_id: str) -> List[Message]:
         state = self.get_conversation(conversation_id)
-        return state.messages if state else []
+        return list(state.messages) if state else []
 
 
 class CommunicationProtocol:
@@ -163,6 +217,12 @@ class CommunicationProtocol:
         await self.message_bus.publish(message)
         return message.id
 
+    async def send_batch(
+        self, messages: List[Message], topic: Optional[str] = None
+    ) -> List[str]:
+        await self.message_bus.publish_batch(messages, topic)
+        return [message.id for message in messages]
+
     async def broadcast_status(
         self,
         sender: Agent,
@@ -186,9 +246,7 @@ class CommunicationProtocol:
         initial_message: str,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> str:
-        import uuid
-
-        conversation_id = str(uuid.uuid4())
+        conversation_id = _IdPool.new_id()
 
         conv_metadata = metadata or {}
         conv_metadata["conversation_id"] = conversation_id
@@ -210,7 +268,7 @@ class CommunicationProtocol:
         if not state:
             raise ValueError(f"Conversation {conversation_id} not found")
 
-        last_message = state.messages[-1] if state.messages else None
+        last_message = state.last_message
         if not last_message:
             raise ValueError("No messages in conversation")
 
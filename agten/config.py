@@ -1,14 +1,69 @@
-from typing import Any, Dict, List, Optional, Union, Type
-from dataclasses import dataclass, field, asdict
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union, Type
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
 import yaml
+import asyncio
 import json
+import copy
+import functools
+import hashlib
 import os
 import logging
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchfiles import Change, awatch
+except ImportError:
+    awatch = None
+
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader/dumper are an order of magnitude faster than the pure
+# Python ones; fall back to those when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _dataclass_dict(obj: Any) -> Dict[str, Any]:
+    # Shallow, unlike asdict(): nested dataclasses are left for the
+    # serializer to visit, so no parallel copy of the tree is built.
+    if not is_dataclass(obj):
+        raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+    return {name: getattr(obj, name) for name in _field_names(type(obj))}
+
+
+if orjson is not None:
+    _JSON_LOADS = orjson.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        # orjson serializes dataclasses natively and always writes raw UTF-8
+        # (no \uXXXX escapes). Non-str keys (e.g. from YAML `{3: x}` in
+        # metadata) are stringified, as json.dumps does.
+        return orjson.dumps(
+            data,
+            default=_dataclass_dict,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+
+else:
+    _JSON_LOADS = json.loads
+
+    def _json_dumps(data: Any) -> bytes:
+        # Match the orjson output: UTF-8 rather than \uXXXX escapes.
+        return json.dumps(
+            data, default=_dataclass_dict, indent=2, ensure_ascii=False
+        ).encode("utf-8")
+
 
 class ConfigFormat(Enum):
     YAML = "yaml"
@@ -16,7 +71,7 @@ class ConfigFormat(Enum):
     ENV = "env"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     name: str
     type: str
@@ -31,7 +86,7 @@ class AgentConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolConfig:
     name: str
     type: str
@@ -44,7 +99,7 @@ class ToolConfig:
     parameters: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommunicationConfig:
     message_bus_type: str = "memory"
     max_message_size: int = 1024 * 1024
@@ -52,7 +107,7 @@ class CommunicationConfig:
     max_conversation_length: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     enable_sandbox: bool = True
     allowed_domains: List[str] = field(default_factory=list)
@@ -62,7 +117,7 @@ class SecurityConfig:
     require_auth: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -72,7 +127,7 @@ class LoggingConfig:
     enable_console: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameworkConfig:
     agents: Dict[str, AgentConfig] = field(default_factory=dict)
     tools: Dict[str, ToolConfig] = field(default_factory=dict)
@@ -83,11 +138,109 @@ class FrameworkConfig:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+class _ConfigDumper(_YAML_DUMPER):
+    # asdict() used to hand the dumper fresh copies; without them a list
+    # shared between fields must not turn into a YAML anchor/alias.
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+for _cls in (
+    AgentConfig,
+    ToolConfig,
+    CommunicationConfig,
+    SecurityConfig,
+    LoggingConfig,
+    FrameworkConfig,
+):
+    _ConfigDumper.add_representer(
+        _cls, lambda dumper, obj: dumper.represent_dict(_dataclass_dict(obj))
+    )
+
+
+_YAML_SUFFIXES = frozenset({".yaml", ".yml"})
+
+
+@functools.lru_cache(maxsize=16)
+def _format_for_suffix(suffix: str) -> Optional[ConfigFormat]:
+    suffix = suffix.lower()
+    if suffix in _YAML_SUFFIXES:
+        return ConfigFormat.YAML
+    elif suffix == ".json":
+        return ConfigFormat.JSON
+    return None
+
+
+_AGENT_FIELDS = frozenset(f.name for f in fields(AgentConfig))
+_TOOL_FIELDS = frozenset(f.name for f in fields(ToolConfig))
+
+# Validation rules as (attribute, check, message), built once at import.
+_AGENT_CHECKS = (
+    ("name", bool, "name is required"),
+    ("type", bool, "type is required"),
+    ("max_concurrent_tasks", lambda v: v >= 1, "max_concurrent_tasks must be >= 1"),
+)
+
+_TOOL_CHECKS = (
+    ("name", bool, "name is required"),
+    ("type", bool, "type is required"),
+    ("timeout", lambda v: v >= 0, "timeout must be >= 0"),
+)
+
+_SECTION_CHECKS = (
+    (
+        "communication",
+        "max_message_size",
+        lambda v: v > 0,
+        "Communication max_message_size must be > 0",
+    ),
+    (
+        "security",
+        "max_file_size_mb",
+        lambda v: v > 0,
+        "Security max_file_size_mb must be > 0",
+    ),
+)
+
+
+# Parsed YAML documents, keyed by a digest of the file's bytes, so a touched
+# or re-saved but unchanged file isn't re-parsed on reload and stale content
+# can never be served. Shared by all managers. JSON isn't cached: orjson
+# parses it faster than a cached tree can be copied.
+_YAML_CACHE: Dict[bytes, Any] = {}
+_YAML_CACHE_SIZE = 32
+
+
+def _copy_data(obj: Any) -> Any:
+    # Parsed YAML is mostly plain dicts, lists and scalars; copying those by
+    # hand is several times faster than copy.deepcopy().
+    if type(obj) is dict:
+        return {key: _copy_data(value) for key, value in obj.items()}
+    if type(obj) is list:
+        return [_copy_data(value) for value in obj]
+    return copy.deepcopy(obj)
+
+
+def _load_yaml(raw: bytes) -> Any:
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+    data = _YAML_CACHE.get(key)
+
+    if data is None:
+        data = yaml.load(raw, Loader=_YAML_LOADER)
+        _YAML_CACHE[key] = data
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.pop(next(iter(_YAML_CACHE)))
+
+    # The cached tree stays pristine; each config gets its own copy.
+    return _copy_data(data)
+
+
 class ConfigManager:
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         self.config_path = Path(config_path) if config_path else None
         self.config = FrameworkConfig()
-        self._watchers: List[callable] = []
+        # (is_async, watcher) in registration order, classified once on add.
+        self._watchers: List[Tuple[bool, callable]] = []
 
     def load_config(
         self,
@@ -104,13 +257,14 @@ class ConfigManager:
             format = self._detect_format(path)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                if format == ConfigFormat.YAML:
-                    data = yaml.safe_load(f)
-                elif format == ConfigFormat.JSON:
-                    data = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported format: {format}")
+            raw = path.read_bytes()
+
+            if format == ConfigFormat.YAML:
+                data = _load_yaml(raw)
+            elif format == ConfigFormat.JSON:
+                data = _JSON_LOADS(raw)
+            else:
+                raise ValueError(f"Unsupported format: {format}")
 
             self.config = self._parse_config(data)
             logger.info(f"Loaded config from {path}")
@@ -135,16 +289,20 @@ class ConfigManager:
         if format is None:
             format = self._detect_format(path) or ConfigFormat.YAML
 
-        data = asdict(self.config)
-
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                if format == ConfigFormat.YAML:
-                    yaml.dump(data, f, default_flow_style=False, indent=2)
-                elif format == ConfigFormat.JSON:
-                    json.dump(data, f, indent=2)
-                else:
-                    raise ValueError(f"Unsupported format: {format}")
+            if format == ConfigFormat.YAML:
+                with open(path, "w", encoding="utf-8") as f:
+                    yaml.dump(
+                        self.config,
+                        f,
+                        Dumper=_ConfigDumper,
+                        default_flow_style=False,
+                        indent=2,
+                    )
+            elif format == ConfigFormat.JSON:
+                path.write_bytes(_json_dumps(self.config))
+            else:
+                raise ValueError(f"Unsupported format: {format}")
 
             logger.info(f"Saved config to {path}")
 
@@ -153,23 +311,22 @@ class ConfigManager:
             raise
 
     def _detect_format(self, path: Path) -> Optional[ConfigFormat]:
-        suffix = path.suffix.lower()
-        if suffix in [".yaml", ".yml"]:
-            return ConfigFormat.YAML
-        elif suffix == ".json":
-            return ConfigFormat.JSON
-        return None
+        return _format_for_suffix(path.suffix)
 
     def _parse_config(self, data: Dict[str, Any]) -> FrameworkConfig:
         config = FrameworkConfig()
 
         if "agents" in data:
-            for name, agent_data in data["agents"].items():
-                config.agents[name] = AgentConfig(**agent_data)
+            config.agents = {
+                name: AgentConfig(**agent_data)
+                for name, agent_data in data["agents"].items()
+            }
 
         if "tools" in data:
-            for name, tool_data in data["tools"].items():
-                config.tools[name] = ToolConfig(**tool_data)
+            config.tools = {
+                name: ToolConfig(**tool_data)
+                for name, tool_data in data["tools"].items()
+            }
 
         if "communication" in data:
             config.communication = CommunicationConfig(**data["communication"])
@@ -212,7 +369,7 @@ class ConfigManager:
 
         config = self.config.agents[agent_name]
         for key, value in kwargs.items():
-            if hasattr(config, key):
+            if key in _AGENT_FIELDS:
                 setattr(config, key, value)
 
         return True
@@ -223,7 +380,7 @@ class ConfigManager:
 
         config = self.config.tools[tool_name]
         for key, value in kwargs.items():
-            if hasattr(config, key):
+            if key in _TOOL_FIELDS:
                 setattr(config, key, value)
 
         return True
@@ -232,31 +389,86 @@ class ConfigManager:
         env = dict(self.config.global_environment)
 
         for agent_config in self.config.agents.values():
-            env.update(agent_config.environment)
+            if agent_config.environment:
+                env |= agent_config.environment
 
         return env
 
     def apply_environment(self) -> None:
         env = self.merge_environment()
-
-        for key, value in env.items():
-            if not os.environ.get(key):
-                os.environ[key] = value
+        # Variables that are already set to a non-empty value win.
+        existing = frozenset(key for key, value in os.environ.items() if value)
+        os.environ.update(
+            {key: value for key, value in env.items() if key not in existing}
+        )
 
         logger.info(f"Applied {len(env)} environment variables")
 
     def add_config_watcher(self, callback: callable) -> None:
-        self._watchers.append(callback)
+        # Compared by identity, so watchers needn't be hashable.
+        if any(watcher is callback for _, watcher in self._watchers):
+            return
+        self._watchers.append((asyncio.iscoroutinefunction(callback), callback))
 
     def remove_config_watcher(self, callback: callable) -> None:
-        if callback in self._watchers:
-            self._watchers.remove(callback)
+        self._watchers = [
+            entry for entry in self._watchers if entry[1] is not callback
+        ]
+
+    async def _notify_watchers(self) -> None:
+        # Watchers run in registration order. Consecutive coroutine watchers
+        # run concurrently, but each plain watcher waits for everything
+        # registered before it.
+        batch = []
+
+        for is_async, watcher in self._watchers:
+            if is_async:
+                batch.append(watcher(self.config))
+                continue
+
+            if batch:
+                await self._await_watchers(batch)
+                batch = []
+
+            try:
+                watcher(self.config)
+            except Exception as e:
+                logger.error(f"Config watcher failed: {e}")
+
+        if batch:
+            await self._await_watchers(batch)
+
+    async def _await_watchers(self, coros: List[Awaitable[Any]]) -> None:
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Config watcher failed: {result}")
 
     async def watch_config(self, interval: float = 1.0) -> None:
         if not self.config_path:
             logger.warning("No config path to watch")
             return
 
+        if awatch is None:
+            await self._poll_config(interval)
+            return
+
+        # Watch the directory rather than the file so editors that save by
+        # writing a temp file and renaming it over the original are seen.
+        path = self.config_path.resolve()
+
+        def is_config_change(change: "Change", changed_path: str) -> bool:
+            return change != Change.deleted and Path(changed_path) == path
+
+        async for _ in awatch(path.parent, watch_filter=is_config_change):
+            try:
+                logger.info("Config file changed, reloading...")
+                self.load_config()
+                await self._notify_watchers()
+            except Exception as e:
+                logger.error(f"Error watching config: {e}")
+
+    async def _poll_config(self, interval: float) -> None:
         last_modified = self.config_path.stat().st_mtime
 
         while True:
@@ -265,15 +477,7 @@ class ConfigManager:
                 if current_modified > last_modified:
                     logger.info("Config file changed, reloading...")
                     self.load_config()
-
-                    for watcher in self._watchers:
-                        try:
-                            if asyncio.iscoroutinefunction(watcher):
-                                await watcher(self.config)
-                            else:
-                                watcher(self.config)
-                        except Exception as e:
-                            logger.error(f"Config watcher failed: {e}")
+                    await self._notify_watchers()
 
                     last_modified = current_modified
 
@@ -283,29 +487,26 @@ class ConfigManager:
                 logger.error(f"Error watching config: {e}")
                 await asyncio.sleep(interval)
 
-    def validate_config(self) -> List[str]:
+    def validate_config(self, *, fast: bool = False) -> List[str]:
+        # fast=True stops at the first error, for callers that only need
+        # to know whether the config is valid.
         errors = []
 
-        for name, agent_config in self.config.agents.items():
-            if not agent_config.name:
-                errors.append(f"Agent {name}: name is required")
-            if not agent_config.type:
-                errors.append(f"Agent {name}: type is required")
-            if agent_config.max_concurrent_tasks < 1:
-                errors.append(f"Agent {name}: max_concurrent_tasks must be >= 1")
-
-        for name, tool_config in self.config.tools.items():
-            if not tool_config.name:
-                errors.append(f"Tool {name}: name is required")
-            if not tool_config.type:
-                errors.append(f"Tool {name}: type is required")
-            if tool_config.timeout < 0:
-                errors.append(f"Tool {name}: timeout must be >= 0")
-
-        if self.config.communication.max_message_size <= 0:
-            errors.append("Communication max_message_size must be > 0")
-
-        if self.config.security.max_file_size_mb <= 0:
-            errors.append("Security max_file_size_mb must be > 0")
+        for label, configs, checks in (
+            ("Agent", self.config.agents, _AGENT_CHECKS),
+            ("Tool", self.config.tools, _TOOL_CHECKS),
+        ):
+            for name, item in configs.items():
+                for attr, check, message in checks:
+                    if not check(getattr(item, attr)):
+                        errors.append(f"{label} {name}: {message}")
+                        if fast:
+                            return errors
+
+        for section, attr, check, message in _SECTION_CHECKS:
+            if not check(getattr(getattr(self.config, section), attr)):
+                errors.append(message)
+                if fast:
+                    return errors
 
         return errors
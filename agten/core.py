@@ -1,14 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union, AsyncGenerator
+from typing import Any, Deque, Dict, List, Optional, Union, AsyncGenerator
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-import uuid
+from functools import cached_property
+import secrets
 import asyncio
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class _IdPool:
+    # Ids are sliced out of one buffered CSPRNG read: a single syscall per
+    # 256 ids instead of an os.urandom() call and UUID formatting per id.
+    _SIZE = 4096
+    _buf: bytes = b""
+    _pos: int = 0
+
+    @classmethod
+    def refill(cls) -> None:
+        cls._buf = secrets.token_bytes(cls._SIZE)
+        cls._pos = 0
+
+    @classmethod
+    def discard(cls) -> None:
+        cls._buf = b""
+        cls._pos = 0
+
+    @classmethod
+    def new_id(cls) -> str:
+        pos = cls._pos
+        if pos + 16 > len(cls._buf):
+            cls.refill()
+            pos = 0
+        cls._pos = pos + 16
+        return cls._buf[pos:pos + 16].hex()
+
+
+# A forked child inherits the buffer; drop it so parent and child don't
+# hand out the same ids.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_IdPool.discard)
+
+
 class AgentStatus(Enum):
     IDLE = "idle"
     THINKING = "thinking"
@@ -27,38 +64,49 @@ class MessageType(Enum):
     TOOL_RESULT = "tool_result"
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_IdPool.new_id)
     type: MessageType = MessageType.TASK
     content: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     sender: Optional[str] = None
     recipient: Optional[str] = None
-    timestamp: float = field(default_factory=lambda: asyncio.get_event_loop().time())
+    timestamp: float = field(default_factory=time.monotonic)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     name: str
     arguments: Dict[str, Any]
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_IdPool.new_id)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "arguments": self.arguments, "id": self.id}
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolResult:
     tool_call_id: str
     result: Any
     success: bool = True
     error: Optional[str] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tool_call_id": self.tool_call_id,
+            "result": self.result,
+            "success": self.success,
+            "error": self.error,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     session_id: str
     user_id: Optional[str] = None
     variables: Dict[str, Any] = field(default_factory=dict)
-    history: List[Message] = field(default_factory=list)
+    history: Deque[Message] = field(default_factory=lambda: deque(maxlen=10_000))
     tools: Dict[str, "Tool"] = field(default_factory=dict)
 
 
@@ -71,7 +119,8 @@ class Tool(ABC):
     async def execute(self, arguments: Dict[str, Any], context: AgentContext) -> Any:
         pass
 
-    @property
+    # Tools don't change after construction, so the schema is built once.
+    @cached_property
     def schema(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -88,11 +137,13 @@ class Agent(ABC):
     def __init__(self, name: str, description: str = ""):
         self.name = name
         self.description = description
-        self.id = str(uuid.uuid4())
+        self.id = _IdPool.new_id()
         self.status = AgentStatus.IDLE
         self.context: Optional[AgentContext] = None
         self.tools: Dict[str, Tool] = {}
-        self._message_queue: asyncio.Queue = asyncio.Queue()
+        self._inbox: Deque[Message] = deque()
+        self._inbox_event = asyncio.Event()
+        self._manager_inbox: Optional[asyncio.Queue] = None
         self._running = False
 
     async def initialize(self, context: AgentContext) -> None:
@@ -111,17 +162,40 @@ class Agent(ABC):
     async def stop(self) -> None:
         self._running = False
         self.status = AgentStatus.COMPLETED
+        # Wake any receive_message() waiting without a timeout.
+        self._inbox_event.set()
         logger.info(f"Agent {self.name} stopped")
 
     async def send_message(self, message: Message) -> None:
-        await self._message_queue.put(message)
-
-    async def receive_message(self) -> Optional[Message]:
-        try:
-            message = await asyncio.wait_for(self._message_queue.get(), timeout=0.1)
-            return message
-        except asyncio.TimeoutError:
-            return None
+        # Managed agents push straight onto the manager's shared inbox so the
+        # manager can await delivery instead of polling every agent.
+        if self._manager_inbox is not None:
+            self._manager_inbox.put_nowait((self, message))
+        else:
+            self._inbox.append(message)
+            self._inbox_event.set()
+
+    async def send_messages(self, messages: List[Message]) -> None:
+        if self._manager_inbox is not None:
+            for message in messages:
+                self._manager_inbox.put_nowait((self, message))
+        else:
+            self._inbox.extend(messages)
+            self._inbox_event.set()
+
+    async def receive_message(
+        self, timeout: Optional[float] = 0.1
+    ) -> Optional[Message]:
+        # Queued messages are returned without touching the event loop; only
+        # an empty inbox waits, for up to `timeout` seconds (None = forever).
+        if not self._inbox:
+            self._inbox_event.clear()
+            try:
+                await asyncio.wait_for(self._inbox_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        return self._inbox.popleft() if self._inbox else None
 
     def register_tool(self, tool: Tool) -> None:
         self.tools[tool.name] = tool
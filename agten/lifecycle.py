@@ -1,4 +1,13 @@
-from typing import Any, Dict, List, Optional, Callable, AsyncGenerator
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
 import asyncio
 import logging
 from datetime import datetime
@@ -23,7 +32,7 @@ class LifecycleEvent(Enum):
     DESTROYED = "destroyed"
 
 
-@dataclass
+@dataclass(slots=True)
 class LifecycleState:
     agent_id: str
     event: LifecycleEvent
@@ -44,23 +53,56 @@ class AgentManager:
         self.lifecycle_handlers: Dict[LifecycleEvent, List[Callable]] = {
             event: [] for event in LifecycleEvent
         }
+        # Whether each handler is a coroutine function, classified once on add
+        # and kept parallel to lifecycle_handlers (handlers needn't be hashable).
+        self._handler_is_async: Dict[LifecycleEvent, List[bool]] = {
+            event: [] for event in LifecycleEvent
+        }
+        self._inbox: asyncio.Queue[Optional[Tuple[Agent, Message]]] = asyncio.Queue()
         self._running = False
         self._shutdown_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
 
     def add_lifecycle_handler(self, event: LifecycleEvent, handler: Callable) -> None:
         self.lifecycle_handlers[event].append(handler)
+        self._handler_is_async[event].append(asyncio.iscoroutinefunction(handler))
 
     async def _emit_lifecycle_event(self, state: LifecycleState) -> None:
-        handlers = self.lifecycle_handlers.get(state.event, [])
-        for handler in handlers:
+        # Handlers run in registration order. Consecutive coroutine handlers
+        # run concurrently, but each plain handler waits for everything
+        # registered before it.
+        batch = []
+
+        for handler, is_async in zip(
+            self.lifecycle_handlers[state.event], self._handler_is_async[state.event]
+        ):
+            if is_async:
+                batch.append(handler(state))
+                continue
+
+            if batch:
+                await self._await_lifecycle_handlers(state, batch)
+                batch = []
+
             try:
-                if asyncio.iscoroutinefunction(handler):
-                    await handler(state)
-                else:
-                    handler(state)
+                result = handler(state)
+                if asyncio.iscoroutine(result):
+                    await result
             except Exception as e:
                 logger.error(f"Lifecycle handler failed for {state.event}: {e}")
 
+        if batch:
+            await self._await_lifecycle_handlers(state, batch)
+
+    async def _await_lifecycle_handlers(
+        self, state: LifecycleState, coros: List[Awaitable[Any]]
+    ) -> None:
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Lifecycle handler failed for {state.event}: {result}")
+
     async def create_agent(
         self,
         agent_class: type,
@@ -82,6 +124,7 @@ class AgentManager:
         )
 
         await agent.initialize(context)
+        agent._manager_inbox = self._inbox
         self.agents[agent.id] = agent
         self.agent_contexts[agent.id] = context
 
@@ -115,7 +158,9 @@ class AgentManager:
 
         logger.info(f"Started agent: {agent.name}")
 
-    async def stop_agent(self, agent_id: str) -> None:
+    async def stop_agent(
+        self, agent_id: str, timestamp: Optional[datetime] = None
+    ) -> None:
         if agent_id not in self.agents:
             raise ValueError(f"Agent {agent_id} not found")
 
@@ -126,29 +171,33 @@ class AgentManager:
             LifecycleState(
                 agent_id=agent_id,
                 event=LifecycleEvent.STOPPED,
-                timestamp=datetime.now(),
+                timestamp=timestamp or datetime.now(),
             )
         )
 
         logger.info(f"Stopped agent: {agent.name}")
 
-    async def destroy_agent(self, agent_id: str) -> None:
-        if agent_id not in self.agents:
+    async def destroy_agent(
+        self, agent_id: str, timestamp: Optional[datetime] = None
+    ) -> None:
+        agent = self.agents.get(agent_id)
+        if agent is None:
             return
 
-        await self.stop_agent(agent_id)
+        timestamp = timestamp or datetime.now()
+        await self.stop_agent(agent_id, timestamp)
 
-        agent = self.agents[agent_id]
         self.message_bus.unsubscribe(agent)
+        agent._manager_inbox = None
 
-        del self.agents[agent_id]
-        del self.agent_contexts[agent_id]
+        self.agents.pop(agent_id, None)
+        self.agent_contexts.pop(agent_id, None)
 
         await self._emit_lifecycle_event(
             LifecycleState(
                 agent_id=agent_id,
                 event=LifecycleEvent.DESTROYED,
-                timestamp=datetime.now(),
+                timestamp=timestamp,
             )
         )
 
@@ -156,6 +205,7 @@ class AgentManager:
 
     async def start_manager(self) -> None:
         self._running = True
+        self._loop = asyncio.get_running_loop()
 
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -171,14 +221,16 @@ class AgentManager:
 
     async def _run_manager_loop(self) -> None:
         while self._running:
-            try:
-                await asyncio.sleep(0.1)
+            item = await self._inbox.get()
+            if item is None:
+                break
 
-                for agent_id, agent in list(self.agents.items()):
-                    message = await agent.receive_message()
-                    if message:
-                        await self._handle_agent_message(agent, message)
+            agent, message = item
+            if agent.id not in self.agents:
+                continue
 
+            try:
+                await self._handle_agent_message(agent, message)
             except Exception as e:
                 logger.error(f"Error in manager loop: {e}")
 
@@ -186,7 +238,7 @@ class AgentManager:
         try:
             response = await agent.process_message(message)
             if response:
-                await self.communication.publish(response)
+                await self.message_bus.publish(response)
         except Exception as e:
             logger.error(f"Error handling message for agent {agent.name}: {e}")
 
@@ -196,7 +248,7 @@ class AgentManager:
                 sender=agent.id,
                 recipient=message.sender,
             )
-            await self.communication.publish(error_message)
+            await self.message_bus.publish(error_message)
 
     async def run_agent_task(
         self, agent_id: str, input_message: str
@@ -234,7 +286,14 @@ class AgentManager:
 
     def _signal_handler(self, signum, frame):
         logger.info(f"Received signal {signum}, shutting down...")
-        asyncio.create_task(self.shutdown())
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._schedule_shutdown)
+
+    def _schedule_shutdown(self) -> None:
+        # Keep a reference to a single shutdown task so repeated signals
+        # don't schedule duplicate teardowns.
+        if self._shutdown_task is None:
+            self._shutdown_task = self._loop.create_task(self.shutdown())
 
     async def shutdown(self) -> None:
         if not self._running:
@@ -242,12 +301,14 @@ class AgentManager:
 
         self._running = False
         self._shutdown_event.set()
+        self._inbox.put_nowait(None)
 
         logger.info("Shutting down agent manager...")
 
+        now = datetime.now()
         tasks = []
         for agent_id in list(self.agents.keys()):
-            task = asyncio.create_task(self.destroy_agent(agent_id))
+            task = asyncio.create_task(self.destroy_agent(agent_id, now))
             tasks.append(task)
 
         if tasks:
@@ -299,13 +360,15 @@ class AgentOrchestrator:
                     )
                     tasks.append(task)
 
-                responses = await asyncio.gather(*tasks)
-                for response in responses:
-                    yield response
+                # Yield each response as soon as its agent finishes rather than
+                # waiting on the slowest one, but join them in declaration
+                # order so the next step's input doesn't depend on timing.
+                for next_response in asyncio.as_completed(tasks):
+                    yield await next_response
 
-                if responses:
+                if tasks:
                     current_input = " ".join(
-                        [r.content for r in responses if r.content]
+                        [r.content for r in (t.result() for t in tasks) if r.content]
                     )
 
     async def _collect_agent_response(
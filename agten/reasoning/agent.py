@@ -1,6 +1,9 @@
-from typing import Any, Dict, List, Optional, AsyncGenerator
-import asyncio
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Set, AsyncGenerator
+from collections import defaultdict, deque
+import heapq
 import logging
+import operator
+import time
 
 from ..core import (
     Agent,
@@ -16,6 +19,13 @@ from .base import CoTReasoningEngine, Thought, Plan, ReasoningStep
 
 logger = logging.getLogger(__name__)
 
+_TASK = MessageType.TASK
+_RESPONSE = MessageType.RESPONSE
+_STATUS = MessageType.STATUS
+_TOOL_CALL = MessageType.TOOL_CALL
+_TOOL_RESULT = MessageType.TOOL_RESULT
+_ERROR = MessageType.ERROR
+
 
 class ReasoningAgent(Agent):
     def __init__(
@@ -27,8 +37,10 @@ class ReasoningAgent(Agent):
         self.model_name = model_name
         self.reasoning_engine = CoTReasoningEngine(model_name)
         self.current_plan: Optional[Plan] = None
-        self.reasoning_history: List[Thought] = []
         self.max_reasoning_steps = 20
+        self.reasoning_history: Deque[Thought] = deque(
+            maxlen=self.max_reasoning_steps * 4
+        )
         self.step_timeout = 300.0
 
     async def initialize(self, context: AgentContext) -> None:
@@ -40,17 +52,17 @@ class ReasoningAgent(Agent):
         self.register_tool(FileWriteTool())
 
     async def process_message(self, message: Message) -> Optional[Message]:
-        if message.type == MessageType.TASK:
+        if message.type == _TASK:
             try:
                 async for response in self._reason_about_task(message.content):
-                    if response.type == MessageType.RESPONSE:
+                    if response.type == _RESPONSE:
                         return response
-                    elif response.type == MessageType.STATUS:
+                    elif response.type == _STATUS:
                         await self._broadcast_status(response.content)
             except Exception as e:
                 logger.error(f"Reasoning failed: {e}")
                 return Message(
-                    type=MessageType.ERROR,
+                    type=_ERROR,
                     content=f"Reasoning process failed: {str(e)}",
                     sender=self.id,
                     recipient=message.sender,
@@ -60,7 +72,7 @@ class ReasoningAgent(Agent):
 
     async def run(self, input_message: str) -> AsyncGenerator[Message, None]:
         yield Message(
-            type=MessageType.STATUS,
+            type=_STATUS,
             content="Starting reasoning process",
             sender=self.id,
         )
@@ -76,7 +88,7 @@ class ReasoningAgent(Agent):
         except Exception as e:
             logger.error(f"Reasoning run failed: {e}")
             yield Message(
-                type=MessageType.ERROR,
+                type=_ERROR,
                 content=f"Reasoning failed: {str(e)}",
                 sender=self.id,
             )
@@ -85,14 +97,14 @@ class ReasoningAgent(Agent):
 
     async def _reason_about_task(self, task: str) -> AsyncGenerator[Message, None]:
         yield Message(
-            type=MessageType.STATUS, content="Analyzing request...", sender=self.id
+            type=_STATUS, content="Analyzing request...", sender=self.id
         )
 
         analysis = await self.reasoning_engine.analyze_request(task, self.context)
         self.reasoning_history.append(analysis)
 
         yield Message(
-            type=MessageType.STATUS,
+            type=_STATUS,
             content=f"Analysis: {analysis.content[:100]}...",
             sender=self.id,
         )
@@ -102,93 +114,98 @@ class ReasoningAgent(Agent):
         )
 
         yield Message(
-            type=MessageType.STATUS,
+            type=_STATUS,
             content=f"Created plan with {len(self.current_plan.steps)} steps",
             sender=self.id,
             metadata={"plan": self.current_plan.steps},
         )
 
-        result = await self._execute_plan_with_reasoning(self.current_plan)
-
-        yield Message(type=MessageType.RESPONSE, content=result, sender=self.id)
+        async for response in self._execute_plan_with_reasoning(self.current_plan):
+            yield response
 
-    async def _execute_plan_with_reasoning(self, plan: Plan) -> str:
+    async def _execute_plan_with_reasoning(
+        self, plan: Plan
+    ) -> AsyncGenerator[Message, None]:
         current_results: List[ToolResult] = []
         completed_steps = 0
+        total = len(plan.steps)
+        max_steps = self.max_reasoning_steps
+        engine = self.reasoning_engine
+        context = self.context
+        agent_id = self.id
 
         for step_num, step in enumerate(plan.steps, 1):
-            if completed_steps >= self.max_reasoning_steps:
-                logger.warning(
-                    f"Reached max reasoning steps {self.max_reasoning_steps}"
-                )
+            if completed_steps >= max_steps:
+                logger.warning(f"Reached max reasoning steps {max_steps}")
                 break
 
             yield Message(
-                type=MessageType.STATUS,
-                content=f"Step {step_num}/{len(plan.steps)}: {step}",
-                sender=self.id,
+                type=_STATUS,
+                content=f"Step {step_num}/{total}: {step}",
+                sender=agent_id,
             )
 
             try:
-                tool_calls = await self.reasoning_engine.select_tools(
-                    step, plan, self.context
-                )
+                tool_calls = await engine.select_tools(step, plan, context)
 
                 if tool_calls:
                     yield Message(
-                        type=MessageType.TOOL_CALL,
+                        type=_TOOL_CALL,
                         content=f"Executing {len(tool_calls)} tools for step {step_num}",
-                        sender=self.id,
-                        metadata={"tool_calls": [tc.__dict__ for tc in tool_calls]},
+                        sender=agent_id,
+                        metadata={"tool_calls": [tc.to_dict() for tc in tool_calls]},
                     )
 
-                    step_results = await self.reasoning_engine.execute_step(
-                        tool_calls, self.context
-                    )
+                    step_results = await engine.execute_step(tool_calls, context)
                     current_results.extend(step_results)
 
                     yield Message(
-                        type=MessageType.TOOL_RESULT,
-                        content=f"Step {step_num} completed with {len([r for r in step_results if r.success])} successful tool executions",
-                        sender=self.id,
-                        metadata={"tool_results": [tr.__dict__ for tr in step_results]},
+                        type=_TOOL_RESULT,
+                        content=f"Step {step_num} completed with {sum(1 for r in step_results if r.success)} successful tool executions",
+                        sender=agent_id,
+                        metadata={"tool_results": [tr.to_dict() for tr in step_results]},
                     )
                 else:
                     step_results = []
 
-                reflection = await self.reasoning_engine.reflect(
-                    plan, step_results, self.context
-                )
+                reflection = await engine.reflect(plan, step_results, context)
                 self.reasoning_history.append(reflection)
 
                 yield Message(
-                    type=MessageType.STATUS,
+                    type=_STATUS,
                     content=f"Reflection: {reflection.content[:150]}...",
-                    sender=self.id,
+                    sender=agent_id,
                 )
 
                 (
                     should_continue,
                     next_action,
-                ) = await self.reasoning_engine.should_continue(
-                    plan, current_results, self.context
+                ) = await engine.should_continue(
+                    plan, current_results, context
                 )
 
                 if not should_continue:
-                    return next_action
+                    yield Message(
+                        type=_RESPONSE, content=next_action, sender=agent_id
+                    )
+                    return
 
                 completed_steps += 1
 
             except Exception as e:
                 logger.error(f"Step {step_num} failed: {e}")
                 yield Message(
-                    type=MessageType.ERROR,
+                    type=_ERROR,
                     content=f"Step {step_num} failed: {str(e)}",
-                    sender=self.id,
+                    sender=agent_id,
                 )
                 break
 
-        return f"Plan execution completed. Processed {completed_steps} steps out of {len(plan.steps)} planned steps."
+        yield Message(
+            type=_RESPONSE,
+            content=f"Plan execution completed. Processed {completed_steps} steps out of {total} planned steps.",
+            sender=agent_id,
+        )
 
     async def _broadcast_status(self, content: str) -> None:
         if self.context and hasattr(self.context, "message_bus"):
@@ -225,8 +242,13 @@ class AdvancedReasoningAgent(ReasoningAgent):
         model_name: str = "google_genai:gemini-2.5-flash-lite",
     ):
         super().__init__(name, model_name)
-        self.memory = []
+        self.memory: Deque[Dict[str, Any]] = deque(maxlen=100)
         self.learning_enabled = True
+        # Index entries are keyed by a running sequence number; the current
+        # position of an entry in memory is its number minus _forgotten.
+        self._token_sets: Deque[FrozenSet[str]] = deque()
+        self._inverted: Dict[str, Set[int]] = defaultdict(set)
+        self._forgotten = 0
 
     async def initialize(self, context: AgentContext) -> None:
         await super().initialize(context)
@@ -238,7 +260,7 @@ class AdvancedReasoningAgent(ReasoningAgent):
 
     async def _reason_about_task(self, task: str) -> AsyncGenerator[Message, None]:
         yield Message(
-            type=MessageType.STATUS,
+            type=_STATUS,
             content="Starting advanced reasoning with memory and learning",
             sender=self.id,
         )
@@ -247,7 +269,7 @@ class AdvancedReasoningAgent(ReasoningAgent):
 
         if similar_tasks:
             yield Message(
-                type=MessageType.STATUS,
+                type=_STATUS,
                 content=f"Found {len(similar_tasks)} similar past tasks to learn from",
                 sender=self.id,
             )
@@ -259,14 +281,18 @@ class AdvancedReasoningAgent(ReasoningAgent):
             self._store_task_memory(task, await self.get_reasoning_summary())
 
     def _find_similar_tasks(self, current_task: str) -> List[Dict[str, Any]]:
-        similar = []
-        current_task_lower = current_task.lower()
+        query = frozenset(current_task.lower().split())
+        inverted = self._inverted
+        candidates = set().union(*(inverted[t] for t in query if t in inverted))
 
-        for memory_item in self.memory:
-            task_similarity = self._calculate_similarity(
-                current_task_lower, memory_item["task"].lower()
-            )
+        similar = []
+        for seq in sorted(candidates):
+            i = seq - self._forgotten
+            tokens = self._token_sets[i]
+            shared = len(tokens & query)
+            task_similarity = shared / (len(tokens) + len(query) - shared)
             if task_similarity > 0.7:
+                memory_item = self.memory[i]
                 similar.append(
                     {
                         "task": memory_item["task"],
@@ -275,24 +301,35 @@ class AdvancedReasoningAgent(ReasoningAgent):
                     }
                 )
 
-        return sorted(similar, key=lambda x: x["similarity"], reverse=True)[:3]
-
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
-        words1 = set(text1.split())
-        words2 = set(text2.split())
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        return len(intersection) / len(union) if union else 0.0
+        return heapq.nlargest(3, similar, key=operator.itemgetter("similarity"))
 
     def _store_task_memory(self, task: str, reasoning_summary: Dict[str, Any]) -> None:
         memory_item = {
             "task": task,
             "reasoning": reasoning_summary,
             "outcome": "completed",
-            "timestamp": asyncio.get_event_loop().time(),
+            "timestamp": time.monotonic(),
         }
 
-        self.memory.append(memory_item)
+        if len(self.memory) == self.memory.maxlen:
+            self._forget_oldest()
 
-        if len(self.memory) > 100:
-            self.memory = self.memory[-50:]
+        self.memory.append(memory_item)
+        self._index_task(task)
+
+    def _index_task(self, task: str) -> None:
+        seq = self._forgotten + len(self._token_sets)
+        tokens = frozenset(task.lower().split())
+        self._token_sets.append(tokens)
+        for token in tokens:
+            self._inverted[token].add(seq)
+
+    def _forget_oldest(self) -> None:
+        self.memory.popleft()
+        seq = self._forgotten
+        for token in self._token_sets.popleft():
+            entries = self._inverted[token]
+            entries.discard(seq)
+            if not entries:
+                del self._inverted[token]
+        self._forgotten += 1
@@ -3,12 +3,26 @@ from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 import logging
+import re
+import time
 from abc import ABC, abstractmethod
 
 from ..core import AgentContext, ToolCall, ToolResult
 
 logger = logging.getLogger(__name__)
 
+_COMMON_TOOLS = ("bash", "file_read", "file_write", "weather", "search", "calculator")
+_COMMON_TOOLS_RE = re.compile("|".join(_COMMON_TOOLS), re.IGNORECASE)
+_BASH_RE = re.compile("bash", re.IGNORECASE)
+# Tools that act on the shell or filesystem may depend on each other's
+# effects (`mkdir x` then `cd x && ...`), so within a step they run one after
+# another, in order. Everything else is independent and runs concurrently.
+_ORDERED_TOOLS = frozenset(
+    {"bash", "file_read", "file_write", "file_analysis", "code_execution"}
+)
+_COMMAND_RE = re.compile(r"command:([^\n]*)", re.IGNORECASE)
+_STEP_RE = re.compile(r"^[ \t]*(- Step[^\n]*)", re.MULTILINE)
+
 
 class ReasoningStep(Enum):
     ANALYZE = "analyze"
@@ -19,7 +33,7 @@ class ReasoningStep(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class Thought:
     step: ReasoningStep
     content: str
@@ -27,10 +41,10 @@ class Thought:
     tool_calls: List[ToolCall] = field(default_factory=list)
     tool_results: List[ToolResult] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: float = field(default_factory=lambda: asyncio.get_event_loop().time())
+    timestamp: float = field(default_factory=time.monotonic)
 
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     objective: str
     steps: List[str]
@@ -129,11 +143,10 @@ Plan format:
 
         response = await self.model.ainvoke(prompt)
 
-        steps = []
-        for line in response.content.split("\n"):
-            if line.strip().startswith("- Step"):
-                step_desc = line.split(":", 1)[-1].strip()
-                steps.append(step_desc)
+        steps = [
+            match.group(1).split(":", 1)[-1].strip()
+            for match in _STEP_RE.finditer(response.content)
+        ]
 
         return Plan(
             objective=request,
@@ -171,38 +184,53 @@ If no tools needed, say "No tools required for this step"
     async def execute_step(
         self, tool_calls: List[ToolCall], context: AgentContext
     ) -> List[ToolResult]:
-        results = []
-
-        for tool_call in tool_calls:
-            if tool_call.name not in context.tools:
-                results.append(
-                    ToolResult(
-                        tool_call_id=tool_call.id,
-                        result=None,
-                        success=False,
-                        error=f"Tool '{tool_call.name}' not available",
-                    )
-                )
-                continue
+        results: List[Optional[ToolResult]] = [None] * len(tool_calls)
+        ordered = []
+        independent = []
+        for index, call in enumerate(tool_calls):
+            if call.name in _ORDERED_TOOLS:
+                ordered.append(index)
+            else:
+                independent.append(index)
 
-            try:
-                tool = context.tools[tool_call.name]
-                result = await tool.execute(tool_call.arguments, context)
-                results.append(
-                    ToolResult(tool_call_id=tool_call.id, result=result, success=True)
-                )
-            except Exception as e:
-                results.append(
-                    ToolResult(
-                        tool_call_id=tool_call.id,
-                        result=None,
-                        success=False,
-                        error=str(e),
-                    )
+        async def run_ordered() -> None:
+            for index in ordered:
+                results[index] = await self._execute_tool_call(
+                    tool_calls[index], context
                 )
 
+        async def run_independent(index: int) -> None:
+            results[index] = await self._execute_tool_call(tool_calls[index], context)
+
+        # The ordered lane runs alongside the independent calls.
+        await asyncio.gather(
+            run_ordered(), *(run_independent(index) for index in independent)
+        )
         return results
 
+    async def _execute_tool_call(
+        self, tool_call: ToolCall, context: AgentContext
+    ) -> ToolResult:
+        if tool_call.name not in context.tools:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                result=None,
+                success=False,
+                error=f"Tool '{tool_call.name}' not available",
+            )
+
+        try:
+            tool = context.tools[tool_call.name]
+            result = await tool.execute(tool_call.arguments, context)
+            return ToolResult(tool_call_id=tool_call.id, result=result, success=True)
+        except Exception as e:
+            return ToolResult(
+                tool_call_id=tool_call.id,
+                result=None,
+                success=False,
+                error=str(e),
+            )
+
     async def reflect(
         self, plan: Plan, step_results: List[ToolResult], context: AgentContext
     ) -> Thought:
@@ -268,33 +296,20 @@ Consider: Are all requirements met? Is the user's request fully satisfied?
             return True, next_action
 
     def _extract_needed_tools(self, content: str) -> List[str]:
-        common_tools = [
-            "bash",
-            "file_read",
-            "file_write",
-            "weather",
-            "search",
-            "calculator",
-        ]
-        tools = []
-        for tool in common_tools:
-            if tool.lower() in content.lower():
-                tools.append(tool)
-        return tools
+        found = {match.lower() for match in _COMMON_TOOLS_RE.findall(content)}
+        return [tool for tool in _COMMON_TOOLS if tool in found]
 
     def _parse_tool_calls(self, content: str) -> List[ToolCall]:
-        tool_calls = []
+        if not _BASH_RE.search(content):
+            return []
 
-        if "bash" in content.lower():
-            lines = content.split("\n")
-            for line in lines:
-                if "command:" in line.lower():
-                    command = line.split("command:", 1)[1].strip().strip('"')
-                    tool_calls.append(
-                        ToolCall(name="bash", arguments={"command": command})
-                    )
-
-        return tool_calls
+        return [
+            ToolCall(
+                name="bash",
+                arguments={"command": match.group(1).strip().strip('"')},
+            )
+            for match in _COMMAND_RE.finditer(content)
+        ]
 
     def _format_results(self, results: List[ToolResult]) -> str:
         formatted = []
@@ -1,6 +1,8 @@
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, MutableMapping, Optional, Type
 import importlib
-import inspect
+import pkgutil
+import sys
+import weakref
 from pathlib import Path
 import logging
 
@@ -10,15 +12,21 @@ logger = logging.getLogger(__name__)
 
 
 class AgentRegistry:
-    def __init__(self):
+    def __init__(self, weak_instances: bool = False):
         self._agents: Dict[str, Type[Agent]] = {}
         self._tools: Dict[str, Type[Tool]] = {}
-        self._agent_instances: Dict[str, Agent] = {}
+        # Strong by default so get_agent() works for callers that only keep
+        # the id; long-running services can opt into weak references so
+        # agents are dropped once nothing else uses them.
+        self._agent_instances: MutableMapping[str, Agent] = (
+            weakref.WeakValueDictionary() if weak_instances else {}
+        )
 
     def register_agent(
         self, agent_class: Type[Agent], name: Optional[str] = None
     ) -> None:
-        agent_name = name or agent_class.__name__
+        # Class names are interned already; explicit names may not be.
+        agent_name = sys.intern(name) if name else agent_class.__name__
         if not issubclass(agent_class, Agent):
             raise ValueError(f"Class {agent_class.__name__} must inherit from Agent")
 
@@ -26,7 +34,7 @@ class AgentRegistry:
         logger.info(f"Registered agent: {agent_name}")
 
     def register_tool(self, tool_class: Type[Tool], name: Optional[str] = None) -> None:
-        tool_name = name or tool_class.__name__
+        tool_name = sys.intern(name) if name else tool_class.__name__
         if not issubclass(tool_class, Tool):
             raise ValueError(f"Class {tool_class.__name__} must inherit from Tool")
 
@@ -34,29 +42,29 @@ class AgentRegistry:
         logger.info(f"Registered tool: {tool_name}")
 
     def create_agent(self, agent_name: str, **kwargs) -> Agent:
-        if agent_name not in self._agents:
+        agent_class = self._agents.get(agent_name)
+        if agent_class is None:
             raise ValueError(f"Agent '{agent_name}' not registered")
 
-        agent_class = self._agents[agent_name]
         instance = agent_class(**kwargs)
         self._agent_instances[instance.id] = instance
         return instance
 
     def create_tool(self, tool_name: str, **kwargs) -> Tool:
-        if tool_name not in self._tools:
+        tool_class = self._tools.get(tool_name)
+        if tool_class is None:
             raise ValueError(f"Tool '{tool_name}' not registered")
 
-        tool_class = self._tools[tool_name]
         return tool_class(**kwargs)
 
     def get_agent(self, agent_id: str) -> Optional[Agent]:
         return self._agent_instances.get(agent_id)
 
     def list_agents(self) -> List[str]:
-        return list(self._agents.keys())
+        return list(self._agents)
 
     def list_tools(self) -> List[str]:
-        return list(self._tools.keys())
+        return list(self._tools)
 
     def auto_discover(self, package_path: str) -> None:
         path = Path(package_path)
@@ -64,24 +72,36 @@ class AgentRegistry:
             logger.warning(f"Package path {package_path} does not exist")
             return
 
-        for module_file in path.rglob("*.py"):
-            if module_file.name.startswith("__"):
-                continue
+        search_root = str(path.resolve().parent)
+        added_to_path = search_root not in sys.path
+        if added_to_path:
+            sys.path.insert(0, search_root)
 
-            module_path = module_file.relative_to(path.parent)
-            module_name = str(module_path.with_suffix("")).replace("/", ".")
+        try:
+            for _, module_name, _ in pkgutil.walk_packages(
+                [str(path)],
+                prefix=f"{path.resolve().name}.",
+                onerror=lambda name: logger.error(f"Failed to load package {name}"),
+            ):
+                if module_name.rpartition(".")[2].startswith("__"):
+                    continue
 
-            try:
-                self._load_module(module_name)
-            except Exception as e:
-                logger.error(f"Failed to load module {module_name}: {e}")
+                try:
+                    self._load_module(module_name)
+                except Exception as e:
+                    logger.error(f"Failed to load module {module_name}: {e}")
+        finally:
+            if added_to_path:
+                sys.path.remove(search_root)
 
     def _load_module(self, module_name: str) -> None:
         try:
-            module = importlib.import_module(module_name)
+            module = sys.modules.get(module_name) or importlib.import_module(
+                module_name
+            )
 
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if inspect.ismodule(obj) or obj.__module__ != module_name:
+            for obj in list(vars(module).values()):
+                if not isinstance(obj, type) or obj.__module__ != module.__name__:
                     continue
 
                 if issubclass(obj, Agent) and obj != Agent:
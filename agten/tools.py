@@ -1,44 +1,134 @@
-from typing import Any, Dict, List, Optional, Callable
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Callable, Pattern, Tuple
 import asyncio
+import os
+import re
+import signal
 import subprocess
-import time
-import psutil
 import logging
 from dataclasses import dataclass, field
+from itertools import count
 
 from .core import Tool, AgentContext, ToolResult
 
+if TYPE_CHECKING:
+    import psutil
+
 logger = logging.getLogger(__name__)
 
+_BYTES_PER_MB = 1024 * 1024
+
+
+def _read_text(path: str) -> str:
+    # One read sized from fstat straight into a bytes object and a single
+    # decode, instead of TextIOWrapper's chunked read-and-decode.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size + 1)
+        if len(data) != size:
+            # Short read of a huge file, a file that grew, or a size-less
+            # file such as /proc entries: read on until EOF.
+            chunks = [data]
+            while chunk := os.read(fd, max(size, 1 << 16)):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+
+    text = data.decode("utf-8")
+    if "\r" in text:
+        # Match text-mode universal newlines.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+_TERMINATE_BACKOFF = (0.01, 0.02, 0.05, 0.1, 0.2, 0.6)
+
+
+def _is_alive(process: "psutil.Process") -> bool:
+    import psutil
+
+    # A zombie still "is running" to psutil until its parent reaps it.
+    return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+
+
+async def _drain(stream: asyncio.StreamReader, limit: int) -> Tuple[str, bool]:
+    # Keep only the last `limit` bytes so a chatty command can't grow the
+    # buffer without bound; the tail is where errors and summaries land.
+    # Also reports whether anything was dropped from the head.
+    buf = bytearray()
+    truncated = False
+    while chunk := await stream.read(1 << 16):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[:-limit]
+            truncated = True
+    # Decode straight from the buffer rather than via a bytes() copy.
+    return buf.decode(errors="replace"), truncated
 
-@dataclass
+
+def _write_text(path: str, content: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+@dataclass(slots=True, frozen=True)
 class ToolConfig:
     timeout: float = 30.0
     max_memory_mb: int = 512
-    allowed_paths: List[str] = field(default_factory=list)
-    blocked_commands: List[str] = field(default_factory=list)
+    allowed_paths: Tuple[str, ...] = ()
+    blocked_commands: Tuple[str, ...] = ()
     require_confirmation: bool = False
+    max_output_bytes: int = 1024 * 1024
+    _blocked_re: Optional[Pattern[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.max_output_bytes <= 0:
+            raise ValueError("max_output_bytes must be > 0")
+        # Frozen, so the blocklist is compiled exactly once. Lists passed by
+        # callers are stored as tuples to keep the instance hashable.
+        object.__setattr__(self, "allowed_paths", tuple(self.allowed_paths))
+        object.__setattr__(self, "blocked_commands", tuple(self.blocked_commands))
+        # All blocked substrings in one alternation, so a command is lowered
+        # once and scanned once instead of once per entry. Lowering beats
+        # re.IGNORECASE here: that flag disables sre's literal-prefix search
+        # and measured 2.5-7x slower per check.
+        if self.blocked_commands:
+            object.__setattr__(
+                self,
+                "_blocked_re",
+                re.compile(
+                    "|".join(re.escape(b.lower()) for b in self.blocked_commands)
+                ),
+            )
+
+    def blocked_pattern(self) -> Optional[Pattern[str]]:
+        return self._blocked_re
 
 
 class ToolExecutor:
     def __init__(self, config: Optional[ToolConfig] = None):
         self.config = config or ToolConfig()
         self._running_tools: Dict[str, asyncio.Task] = {}
-        self._tool_processes: Dict[str, psutil.Process] = {}
+        self._tool_processes: Dict[str, "psutil.Process"] = {}
+        self._id_counter = count()
 
     async def execute_tool(
         self, tool: Tool, arguments: Dict[str, Any], context: AgentContext
     ) -> ToolResult:
-        tool_id = f"{tool.name}_{int(time.time())}"
+        tool_id = f"{tool.name}_{next(self._id_counter)}"
 
-        try:
-            task = asyncio.create_task(
-                self._execute_with_limits(tool, arguments, context, tool_id)
-            )
-            self._running_tools[tool_id] = task
+        # Each call runs in its own task so cancel_all_tools() interrupts the
+        # tool only, never the caller awaiting it.
+        task = asyncio.create_task(
+            self._execute_with_limits(tool, arguments, context, tool_id)
+        )
+        self._running_tools[tool_id] = task
 
-            result = await asyncio.wait_for(task, timeout=self.config.timeout)
-            return result
+        try:
+            return await asyncio.wait_for(task, timeout=self.config.timeout)
 
         except asyncio.TimeoutError:
             await self._cleanup_tool(tool_id)
@@ -48,6 +138,17 @@ class ToolExecutor:
                 success=False,
                 error=f"Tool execution timed out after {self.config.timeout} seconds",
             )
+        except asyncio.CancelledError:
+            # Re-raise if the caller itself is being cancelled; otherwise
+            # only the tool was (via cancel_all_tools) and that's a result.
+            if asyncio.current_task().cancelling():
+                raise
+            return ToolResult(
+                tool_call_id=tool_id,
+                result=None,
+                success=False,
+                error="Tool execution cancelled",
+            )
         except Exception as e:
             await self._cleanup_tool(tool_id)
             return ToolResult(
@@ -59,6 +160,16 @@ class ToolExecutor:
         finally:
             self._running_tools.pop(tool_id, None)
 
+    async def execute_many(
+        self, calls: List[Tuple[Tool, Dict[str, Any], AgentContext]]
+    ) -> List[Any]:
+        # Each call keeps its own timeout; independent lookups overlap instead
+        # of summing their latencies.
+        return await asyncio.gather(
+            *(self.execute_tool(tool, args, context) for tool, args, context in calls),
+            return_exceptions=True,
+        )
+
     async def _execute_with_limits(
         self, tool: Tool, arguments: Dict[str, Any], context: AgentContext, tool_id: str
     ) -> ToolResult:
@@ -87,22 +198,39 @@ class ToolExecutor:
                 error=f"Command '{command}' is not allowed",
             )
 
+        import psutil
+
+        process = None
         try:
             process = await asyncio.create_subprocess_shell(
                 command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self._get_working_directory(context),
+                start_new_session=True,
             )
 
-            self._tool_processes[tool_id] = psutil.Process(process.pid)
+            try:
+                self._tool_processes[tool_id] = psutil.Process(process.pid)
+            except psutil.NoSuchProcess:
+                # Already exited; nothing left to monitor.
+                pass
 
-            stdout, stderr = await process.communicate()
+            limit = self.config.max_output_bytes
+            (stdout, stdout_truncated), (stderr, stderr_truncated), _ = (
+                await asyncio.gather(
+                    _drain(process.stdout, limit),
+                    _drain(process.stderr, limit),
+                    process.wait(),
+                )
+            )
 
             result = {
-                "stdout": stdout.decode() if stdout else "",
-                "stderr": stderr.decode() if stderr else "",
+                "stdout": stdout,
+                "stderr": stderr,
                 "returncode": process.returncode,
+                "stdout_truncated": stdout_truncated,
+                "stderr_truncated": stderr_truncated,
             }
 
             return ToolResult(
@@ -118,45 +246,63 @@ class ToolExecutor:
             )
         finally:
             self._tool_processes.pop(tool_id, None)
+            if process is not None and process.returncode is None:
+                # Timed out or cancelled: don't leave the command running.
+                await self._kill_process_group(process)
+
+    async def _kill_process_group(self, process: asyncio.subprocess.Process) -> None:
+        # The shell runs in its own session, so killing the group also takes
+        # down anything it spawned.
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
 
     def _is_blocked_command(self, command: str) -> bool:
-        command_lower = command.lower()
-        for blocked in self.config.blocked_commands:
-            if blocked.lower() in command_lower:
-                return True
-        return False
+        blocked_re = self.config.blocked_pattern()
+        return blocked_re is not None and blocked_re.search(command.lower()) is not None
 
     def _get_working_directory(self, context: AgentContext) -> str:
         return context.variables.get("working_directory", ".")
 
     async def _cleanup_tool(self, tool_id: str) -> None:
-        if tool_id in self._running_tools:
-            task = self._running_tools[tool_id]
+        task = self._running_tools.get(tool_id)
+        if task is not None and not task.done():
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+            # wait() rather than await: let the tool's own cleanup run
+            # without re-raising its cancellation here.
+            await asyncio.wait([task])
 
         if tool_id in self._tool_processes:
+            import psutil
+
             process = self._tool_processes[tool_id]
             try:
                 process.terminate()
-                await asyncio.sleep(1)
-                if process.is_running():
-                    process.kill()
+                # Back off up to ~1s in total, but return as soon as it exits.
+                for delay in _TERMINATE_BACKOFF:
+                    if not _is_alive(process):
+                        break
+                    await asyncio.sleep(delay)
+                else:
+                    if _is_alive(process):
+                        process.kill()
             except psutil.NoSuchProcess:
                 pass
 
     async def get_resource_usage(self) -> Dict[str, Any]:
+        import psutil
+
         usage = {}
         for tool_id, process in self._tool_processes.items():
             try:
-                usage[tool_id] = {
-                    "cpu_percent": process.cpu_percent(),
-                    "memory_mb": process.memory_info().rss / 1024 / 1024,
-                    "status": process.status(),
-                }
+                with process.oneshot():
+                    usage[tool_id] = {
+                        "cpu_percent": process.cpu_percent(),
+                        "memory_mb": process.memory_info().rss / _BYTES_PER_MB,
+                        "status": process.status(),
+                    }
             except psutil.NoSuchProcess:
                 usage[tool_id] = {"status": "terminated"}
         return usage
@@ -166,6 +312,22 @@ class ToolExecutor:
             await self._cleanup_tool(tool_id)
 
 
+_BASH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "command": {
+            "type": "string",
+            "description": "The bash command to execute",
+        },
+        "timeout": {
+            "type": "number",
+            "description": "Timeout in seconds (optional)",
+        },
+    },
+    "required": ["command"],
+}
+
+
 class BashTool(Tool):
     def __init__(self, executor: Optional[ToolExecutor] = None):
         super().__init__("bash", "Execute bash commands with safety limits")
@@ -175,20 +337,16 @@ class BashTool(Tool):
         return await self.executor.execute_tool(self, arguments, context)
 
     def _get_parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "command": {
-                    "type": "string",
-                    "description": "The bash command to execute",
-                },
-                "timeout": {
-                    "type": "number",
-                    "description": "Timeout in seconds (optional)",
-                },
-            },
-            "required": ["command"],
-        }
+        return _BASH_SCHEMA
+
+
+_FILE_READ_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "Path to the file to read"}
+    },
+    "required": ["path"],
+}
 
 
 class FileReadTool(Tool):
@@ -201,21 +359,27 @@ class FileReadTool(Tool):
             raise ValueError("File path is required")
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            content = await asyncio.to_thread(_read_text, file_path)
 
             return {"content": content, "size": len(content), "path": file_path}
         except Exception as e:
             raise RuntimeError(f"Failed to read file {file_path}: {str(e)}")
 
     def _get_parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {"type": "string", "description": "Path to the file to read"}
-            },
-            "required": ["path"],
-        }
+        return _FILE_READ_SCHEMA
+
+
+_FILE_WRITE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "Path to the file to write"},
+        "content": {
+            "type": "string",
+            "description": "Content to write to the file",
+        },
+    },
+    "required": ["path", "content"],
+}
 
 
 class FileWriteTool(Tool):
@@ -230,22 +394,11 @@ class FileWriteTool(Tool):
             raise ValueError("File path is required")
 
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            await asyncio.to_thread(_write_text, file_path, content)
 
             return {"path": file_path, "size": len(content), "success": True}
         except Exception as e:
             raise RuntimeError(f"Failed to write file {file_path}: {str(e)}")
 
     def _get_parameters_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "path": {"type": "string", "description": "Path to the file to write"},
-                "content": {
-                    "type": "string",
-                    "description": "Content to write to the file",
-                },
-            },
-            "required": ["path", "content"],
-        }
+        return _FILE_WRITE_SCHEMA
@@ -5,6 +5,26 @@ from agten.communication import MessageBus, CommunicationProtocol, ConversationS
 from agten.core import Message, MessageType, Agent, AgentStatus
 
 
+class SimpleChatAgent(Agent):
+    def __init__(self, name="SimpleChatAgent", description="A simple chat agent"):
+        super().__init__(name, description)
+
+    async def process_message(self, message):
+        if message.type == MessageType.TASK:
+            return Message(
+                type=MessageType.RESPONSE,
+                content=f"Echo: {message.content}",
+                sender=self.id,
+                recipient=message.sender,
+            )
+        return None
+
+    async def run(self, input_message):
+        yield Message(
+            type=MessageType.RESPONSE, content=f"Echo: {input_message}", sender=self.id
+        )
+
+
 class TestMessageBus:
     def test_message_bus_initialization(self):
         bus = MessageBus()
@@ -29,6 +49,21 @@ class TestMessageBus:
 
         assert agent in bus._global_subscribers
 
+    @pytest.mark.asyncio
+    async def test_subscribe_twice_delivers_once(self):
+        bus = MessageBus()
+        agent = SimpleChatAgent("TestAgent")
+
+        bus.subscribe(agent, "test_topic")
+        bus.subscribe(agent, "test_topic")
+
+        assert len(bus._subscribers["test_topic"]) == 1
+
+        await bus.publish(Message(type=MessageType.STATUS, content="once"), "test_topic")
+
+        assert await agent.receive_message() is not None
+        assert await agent.receive_message() is None
+
     def test_unsubscribe_agent(self):
         bus = MessageBus()
         agent = SimpleChatAgent("TestAgent")
@@ -96,6 +131,44 @@ class TestMessageBus:
         assert received2 is not None
         assert received2.content == "Targeted message"
 
+    @pytest.mark.asyncio
+    async def test_publish_to_recipient_on_topic(self):
+        bus = MessageBus()
+
+        agent1 = SimpleChatAgent("Agent1")
+        agent2 = SimpleChatAgent("Agent2")
+
+        bus.subscribe(agent1)
+        bus.subscribe(agent2, "test_topic")
+
+        message = Message(
+            type=MessageType.TASK, content="Direct message", recipient=agent2.id
+        )
+
+        await bus.publish(message)
+
+        assert await agent1.receive_message() is None
+        received = await agent2.receive_message()
+        assert received is not None
+        assert received.content == "Direct message"
+
+    @pytest.mark.asyncio
+    async def test_publish_to_unsubscribed_recipient(self):
+        bus = MessageBus()
+
+        agent = SimpleChatAgent("Agent")
+
+        bus.subscribe(agent)
+        bus.unsubscribe(agent)
+
+        assert agent.id not in bus._agents_by_id
+
+        await bus.publish(
+            Message(type=MessageType.TASK, content="Lost", recipient=agent.id)
+        )
+
+        assert await agent.receive_message() is None
+
     def test_conversation_state(self):
         bus = MessageBus()
 
@@ -112,6 +185,22 @@ class TestMessageBus:
         assert len(state.messages) == 1
         assert state.messages[0] == message
 
+    def test_conversation_history_is_bounded(self):
+        bus = MessageBus(max_conversation_length=2)
+
+        messages = [
+            Message(
+                type=MessageType.TASK,
+                content=f"Message {i}",
+                metadata={"conversation_id": "conv_123"},
+            )
+            for i in range(3)
+        ]
+        for message in messages:
+            bus._update_conversation(message)
+
+        assert bus.get_conversation_history("conv_123") == messages[1:]
+
     def test_get_conversation_history(self):
         bus = MessageBus()
 
@@ -205,6 +294,35 @@ class TestCommunicationProtocol:
         assert received.type == MessageType.ERROR
         assert received.content == "Something went wrong"
 
+    @pytest.mark.asyncio
+    async def test_send_batch(self):
+        bus = MessageBus()
+        protocol = CommunicationProtocol(bus)
+
+        agent1 = SimpleChatAgent("Agent1")
+        agent2 = SimpleChatAgent("Agent2")
+
+        bus.subscribe(agent1)
+        bus.subscribe(agent2)
+
+        messages = [
+            Message(type=MessageType.TASK, content="Task 1", recipient=agent1.id),
+            Message(type=MessageType.TASK, content="Task 2", recipient=agent2.id),
+            Message(type=MessageType.TASK, content="Task 3", recipient=agent1.id),
+            Message(type=MessageType.STATUS, content="Broadcast"),
+        ]
+
+        message_ids = await protocol.send_batch(messages)
+
+        assert message_ids == [m.id for m in messages]
+
+        received1 = [(await agent1.receive_message()).content for _ in range(3)]
+        received2 = [(await agent2.receive_message()).content for _ in range(2)]
+
+        assert received1 == ["Task 1", "Task 3", "Broadcast"]
+        assert received2 == ["Task 2", "Broadcast"]
+        assert await agent1.receive_message() is None
+
     @pytest.mark.asyncio
     async def test_broadcast_status(self):
         bus = MessageBus()
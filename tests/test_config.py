@@ -1,12 +1,15 @@
 import pytest
 import tempfile
+import asyncio
+from dataclasses import dataclass, field
 import os
 from pathlib import Path
+from unittest.mock import patch
 from agten.config import (
     ConfigManager, FrameworkConfig, AgentConfig, ToolConfig,
     CommunicationConfig, SecurityConfig, LoggingConfig, ConfigFormat
 )
-from agents.tools import BashTool, FileReadTool
+from agten.tools import BashTool, FileReadTool
 
 
 class TestConfigManager:
@@ -60,6 +63,71 @@ class TestConfigManager:
         assert "test_tool" in loaded_config.tools
         assert loaded_config.tools["test_tool"].timeout == 60.0
 
+    def test_save_json_with_non_str_keys(self, tmp_path):
+        manager = ConfigManager()
+        manager.config.metadata = {3: "x", "name": "y"}
+
+        config_path = tmp_path / "test_config.json"
+        manager.save_config(config_path, ConfigFormat.JSON)
+
+        loaded_config = ConfigManager().load_config(config_path)
+        assert loaded_config.metadata == {"3": "x", "name": "y"}
+
+    def test_save_json_writes_utf8(self, tmp_path):
+        manager = ConfigManager()
+        manager.config.metadata = {"owner": "caf\u00e9"}
+
+        config_path = tmp_path / "test_config.json"
+        manager.save_config(config_path, ConfigFormat.JSON)
+
+        assert "caf\u00e9".encode("utf-8") in config_path.read_bytes()
+        loaded_config = ConfigManager().load_config(config_path)
+        assert loaded_config.metadata == {"owner": "caf\u00e9"}
+
+    def test_load_config_reuses_parse_for_unchanged_file(self, tmp_path):
+        manager = ConfigManager()
+        manager.config.agents["test_agent"] = AgentConfig(
+            name="test_agent", type="TestAgent"
+        )
+
+        config_path = tmp_path / "test_config.yaml"
+        manager.save_config(config_path)
+
+        new_manager = ConfigManager()
+        first = new_manager.load_config(config_path)
+        first.agents["test_agent"].tools.append("bash")
+
+        config_path.touch()
+        with patch("agten.config.yaml.load") as yaml_load:
+            second = new_manager.load_config(config_path)
+
+        yaml_load.assert_not_called()
+        assert second is not first
+        assert second.agents["test_agent"].tools == []
+
+    def test_load_config_parse_is_shared_between_managers(self, tmp_path):
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text("metadata:\n  tags: [a]\n")
+
+        first = ConfigManager().load_config(config_path)
+        first.metadata["tags"].append("b")
+        with patch("agten.config.yaml.load") as yaml_load:
+            second = ConfigManager().load_config(config_path)
+
+        yaml_load.assert_not_called()
+        assert second.metadata == {"tags": ["a"]}
+
+    def test_load_config_sees_rewrite_with_same_size_and_mtime(self, tmp_path):
+        config_path = tmp_path / "test_config.yaml"
+        config_path.write_text("metadata:\n  owner: alice\n")
+        stat = config_path.stat()
+        assert ConfigManager().load_config(config_path).metadata == {"owner": "alice"}
+
+        config_path.write_text("metadata:\n  owner: carol\n")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert ConfigManager().load_config(config_path).metadata == {"owner": "carol"}
+
     def test_load_nonexistent_file(self):
         manager = ConfigManager()
         
@@ -172,7 +240,7 @@ class TestConfigManager:
         manager.config.agents["test_agent"] = AgentConfig(
             name="test_agent",
             type="TestAgent",
-            timeout: 30.0
+            timeout=30.0
         )
         
         updated = manager.update_agent_config("test_agent", timeout=60.0)
@@ -180,6 +248,22 @@ class TestConfigManager:
         assert updated is True
         assert manager.config.agents["test_agent"].timeout == 60.0
 
+    def test_update_agent_config_ignores_unknown_keys(self):
+        manager = ConfigManager()
+
+        manager.config.agents["test_agent"] = AgentConfig(
+            name="test_agent",
+            type="TestAgent",
+        )
+
+        updated = manager.update_agent_config(
+            "test_agent", __class__=dict, retry_attempts=5
+        )
+
+        assert updated is True
+        assert isinstance(manager.config.agents["test_agent"], AgentConfig)
+        assert manager.config.agents["test_agent"].retry_attempts == 5
+
     def test_merge_environment(self):
         manager = ConfigManager()
         
@@ -221,8 +305,9 @@ class TestConfigManager:
             pass
         
         manager.add_config_watcher(test_watcher)
+        manager.add_config_watcher(test_watcher)
         
-        assert test_watcher in manager._watchers
+        assert manager._watchers == [(False, test_watcher)]
 
     def test_remove_config_watcher(self):
         manager = ConfigManager()
@@ -233,7 +318,73 @@ class TestConfigManager:
         manager.add_config_watcher(test_watcher)
         manager.remove_config_watcher(test_watcher)
         
-        assert test_watcher not in manager._watchers
+        assert manager._watchers == []
+
+    @pytest.mark.asyncio
+    async def test_notify_watchers(self):
+        manager = ConfigManager()
+        seen = []
+
+        def sync_watcher(config):
+            seen.append(("sync", config))
+
+        async def async_watcher(config):
+            seen.append(("async", config))
+
+        async def failing_watcher(config):
+            raise RuntimeError("boom")
+
+        manager.add_config_watcher(sync_watcher)
+        manager.add_config_watcher(async_watcher)
+        manager.add_config_watcher(failing_watcher)
+
+        assert (True, async_watcher) in manager._watchers
+
+        await manager._notify_watchers()
+
+        assert ("sync", manager.config) in seen
+        assert ("async", manager.config) in seen
+
+    @pytest.mark.asyncio
+    async def test_notify_watchers_in_registration_order(self):
+        manager = ConfigManager()
+        calls = []
+
+        def first(config):
+            calls.append("first")
+
+        async def second(config):
+            await asyncio.sleep(0.01)
+            calls.append("second")
+
+        def third(config):
+            calls.append("third")
+
+        for watcher in (first, second, third):
+            manager.add_config_watcher(watcher)
+
+        await manager._notify_watchers()
+
+        assert calls == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_config_watcher(self):
+        @dataclass
+        class Recorder:
+            configs: list = field(default_factory=list)
+
+            def __call__(self, config):
+                self.configs.append(config)
+
+        manager = ConfigManager()
+        recorder = Recorder()
+        manager.add_config_watcher(recorder)
+
+        await manager._notify_watchers()
+        manager.remove_config_watcher(recorder)
+
+        assert recorder.configs == [manager.config]
+        assert manager._watchers == []
 
     def test_validate_config_valid(self):
         manager = ConfigManager()
@@ -273,6 +424,18 @@ class TestConfigManager:
         assert any("name is required" in error for error in errors)
         assert any("must be >= 1" in error for error in errors)
 
+    def test_validate_config_fast_stops_at_first_error(self):
+        manager = ConfigManager()
+        manager.config.agents["invalid_agent"] = AgentConfig(
+            name="", type="", max_concurrent_tasks=0
+        )
+        manager.config.security.max_file_size_mb = 0
+
+        assert manager.validate_config(fast=True) == [
+            "Agent invalid_agent: name is required"
+        ]
+        assert len(manager.validate_config()) == 4
+
 
 class TestAgentConfig:
     def test_agent_config_creation(self):
@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import os
 from unittest.mock import Mock, AsyncMock, patch
 from agten.core import (
     Agent,
@@ -63,6 +64,10 @@ class TestTool:
         assert schema["description"] == "A mock tool for testing"
         assert "parameters" in schema
 
+    def test_tool_schema_is_built_once(self):
+        tool = MockTool()
+        assert tool.schema is tool.schema
+
     @pytest.mark.asyncio
     async def test_tool_execution(self):
         tool = MockTool()
@@ -71,6 +76,22 @@ class TestTool:
         result = await tool.execute({"test_param": "value"}, context)
         assert result == "Mock tool executed with args: {'test_param': 'value'}"
 
+    def test_tool_call_and_result_to_dict(self):
+        tool_call = ToolCall(name="mock_tool", arguments={"test_param": "value"})
+        tool_result = ToolResult(tool_call_id=tool_call.id, result="done")
+
+        assert tool_call.to_dict() == {
+            "name": "mock_tool",
+            "arguments": {"test_param": "value"},
+            "id": tool_call.id,
+        }
+        assert tool_result.to_dict() == {
+            "tool_call_id": tool_call.id,
+            "result": "done",
+            "success": True,
+            "error": None,
+        }
+
 
 class TestMessage:
     def test_message_creation(self):
@@ -95,6 +116,33 @@ class TestMessage:
 
         assert message.metadata == metadata
 
+    @pytest.mark.asyncio
+    async def test_message_ids_are_unique(self):
+        ids = {Message(type=MessageType.TASK, content="x").id for _ in range(1000)}
+
+        assert len(ids) == 1000
+        assert all(len(message_id) == 32 for message_id in ids)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_message_ids_differ_across_fork(self):
+        Message(type=MessageType.TASK, content="warm up the id buffer")
+        read_fd, write_fd = os.pipe()
+
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, Message(type=MessageType.TASK, content="x").id.encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = Message(type=MessageType.TASK, content="x").id
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_id = pipe.read().decode()
+        os.waitpid(pid, 0)
+
+        assert len(child_id) == 32
+        assert child_id != parent_id
+
 
 class TestAgent:
     @pytest.mark.asyncio
@@ -226,3 +274,22 @@ class TestAgent:
         assert status["status"] == AgentStatus.IDLE.value
         assert "tools" in status
         assert "context" in status
+
+    @pytest.mark.asyncio
+    async def test_agent_receive_waits_for_message(self):
+        agent = MockAgent()
+
+        receiver = asyncio.create_task(agent.receive_message(timeout=None))
+        await asyncio.sleep(0)
+
+        await agent.send_message(Message(type=MessageType.TASK, content="Late"))
+        received = await asyncio.wait_for(receiver, timeout=1.0)
+
+        assert received is not None
+        assert received.content == "Late"
+
+    @pytest.mark.asyncio
+    async def test_agent_receive_empty_returns_none(self):
+        agent = MockAgent()
+
+        assert await agent.receive_message(timeout=0.01) is None
@@ -0,0 +1,165 @@
+import pytest
+import asyncio
+from dataclasses import dataclass, field
+from agten.lifecycle import AgentManager, AgentOrchestrator, LifecycleEvent
+from agten.core import Agent, Message, MessageType
+
+
+class EchoAgent(Agent):
+    def __init__(self, name="EchoAgent", description="An agent that echoes tasks"):
+        super().__init__(name, description)
+        self.received = []
+
+    async def process_message(self, message):
+        self.received.append(message)
+        if message.type == MessageType.TASK:
+            return Message(
+                type=MessageType.RESPONSE,
+                content=f"Echo: {message.content}",
+                sender=self.id,
+                recipient=message.sender,
+            )
+        return None
+
+    async def run(self, input_message):
+        yield Message(
+            type=MessageType.RESPONSE, content=f"Echo: {input_message}", sender=self.id
+        )
+
+
+class TestAgentManager:
+    @pytest.mark.asyncio
+    async def test_manager_loop_dispatches_messages(self):
+        manager = AgentManager()
+        sender = await manager.create_agent(EchoAgent, "Sender")
+        recipient = await manager.create_agent(EchoAgent, "Recipient")
+
+        manager._running = True
+        loop_task = asyncio.create_task(manager._run_manager_loop())
+
+        await manager.communication.send_task(sender, recipient.id, "ping")
+        await asyncio.sleep(0.01)
+
+        assert [m.content for m in recipient.received] == ["ping"]
+        assert [m.content for m in sender.received] == ["Echo: ping"]
+
+        await manager.shutdown()
+        await asyncio.wait_for(loop_task, timeout=1.0)
+
+        assert len(manager.agents) == 0
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_handlers(self):
+        manager = AgentManager()
+        events = []
+
+        def on_created(state):
+            events.append(("sync", state.event))
+
+        async def on_initialized(state):
+            events.append(("async", state.event))
+
+        manager.add_lifecycle_handler(LifecycleEvent.CREATED, on_created)
+        manager.add_lifecycle_handler(LifecycleEvent.INITIALIZED, on_initialized)
+
+        await manager.create_agent(EchoAgent, "Agent")
+
+        assert events == [
+            ("sync", LifecycleEvent.CREATED),
+            ("async", LifecycleEvent.INITIALIZED),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_initialized_timestamp_follows_initialize(self):
+        class SlowInitAgent(EchoAgent):
+            async def initialize(self, context):
+                await asyncio.sleep(0.05)
+                await super().initialize(context)
+
+        manager = AgentManager()
+        timestamps = {}
+
+        def record(state):
+            timestamps[state.event] = state.timestamp
+
+        manager.add_lifecycle_handler(LifecycleEvent.CREATED, record)
+        manager.add_lifecycle_handler(LifecycleEvent.INITIALIZED, record)
+
+        await manager.create_agent(SlowInitAgent, "Agent")
+
+        created = timestamps[LifecycleEvent.CREATED]
+        initialized = timestamps[LifecycleEvent.INITIALIZED]
+        assert (initialized - created).total_seconds() >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_mixed_lifecycle_handlers_keep_registration_order(self):
+        manager = AgentManager()
+        events = []
+
+        async def first(state):
+            await asyncio.sleep(0.01)
+            events.append("first")
+
+        def second(state):
+            events.append("second")
+
+        async def third(state):
+            events.append("third")
+
+        for handler in (first, second, third):
+            manager.add_lifecycle_handler(LifecycleEvent.CREATED, handler)
+
+        await manager.create_agent(EchoAgent, "Agent")
+
+        assert events == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_unhashable_lifecycle_handler(self):
+        @dataclass
+        class Recorder:
+            events: list = field(default_factory=list)
+
+            def __call__(self, state):
+                self.events.append(state.event)
+
+        manager = AgentManager()
+        recorder = Recorder()
+        manager.add_lifecycle_handler(LifecycleEvent.CREATED, recorder)
+
+        await manager.create_agent(EchoAgent, "Agent")
+
+        assert recorder.events == [LifecycleEvent.CREATED]
+
+class DelayedEchoAgent(EchoAgent):
+    def __init__(self, name="DelayedEchoAgent", delay=0.0):
+        super().__init__(name)
+        self.delay = delay
+
+    async def run(self, input_message):
+        await asyncio.sleep(self.delay)
+        yield Message(type=MessageType.RESPONSE, content=self.name, sender=self.id)
+
+
+class TestAgentOrchestrator:
+    @pytest.mark.asyncio
+    async def test_parallel_step_joins_in_declaration_order(self):
+        manager = AgentManager()
+        slow = await manager.create_agent(DelayedEchoAgent, "slow", delay=0.05)
+        fast = await manager.create_agent(DelayedEchoAgent, "fast")
+        last = await manager.create_agent(EchoAgent, "last")
+
+        orchestrator = AgentOrchestrator(manager)
+        orchestrator.register_workflow(
+            "fan_out",
+            [
+                {"agent": slow.id, "type": "parallel", "agents": [slow.id, fast.id]},
+                {"agent": last.id},
+            ],
+        )
+
+        messages = [
+            message.content
+            async for message in orchestrator.execute_workflow("fan_out", "go")
+        ]
+
+        assert messages == ["fast", "slow", "Echo: slow fast"]
@@ -0,0 +1,78 @@
+import pytest
+import asyncio
+from agten.core import Tool, AgentContext, ToolCall
+from agten.reasoning.base import CoTReasoningEngine
+from agten.reasoning.tools import CodeExecutionTool
+
+
+class RecordingTool(Tool):
+    def __init__(self, name, log, delay=0.0):
+        super().__init__(name, "Records when each call starts and ends")
+        self.log = log
+        self.delay = delay
+
+    async def execute(self, arguments, context):
+        self.log.append(("start", arguments["value"]))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", arguments["value"]))
+        return arguments["value"]
+
+    def _get_parameters_schema(self):
+        return {"type": "object", "properties": {}}
+
+
+class TestCoTReasoningEngine:
+    @pytest.mark.asyncio
+    async def test_execute_step_orders_bash_calls(self):
+        log = []
+        context = AgentContext(
+            session_id="test",
+            tools={
+                "bash": RecordingTool("bash", log, delay=0.02),
+                "search": RecordingTool("search", log, delay=0.05),
+            },
+        )
+        calls = [
+            ToolCall(name="bash", arguments={"value": "mkdir"}),
+            ToolCall(name="search", arguments={"value": "search"}),
+            ToolCall(name="bash", arguments={"value": "cd"}),
+        ]
+
+        results = await CoTReasoningEngine().execute_step(calls, context)
+
+        assert [r.result for r in results] == ["mkdir", "search", "cd"]
+        assert log.index(("end", "mkdir")) < log.index(("start", "cd"))
+        # The independent search overlaps the bash calls.
+        assert log.index(("start", "search")) < log.index(("end", "mkdir"))
+
+
+class TestCodeExecutionTool:
+    @pytest.mark.asyncio
+    async def test_execute_python(self):
+        tool = CodeExecutionTool()
+        context = AgentContext(session_id="test")
+
+        result = await tool.execute({"code": "print(6 * 7)"}, context)
+
+        assert result["success"]
+        assert result["result"] == "42\n"
+
+    @pytest.mark.asyncio
+    async def test_execute_python_exception(self):
+        tool = CodeExecutionTool()
+        context = AgentContext(session_id="test")
+
+        result = await tool.execute({"code": "raise ValueError('bad')"}, context)
+
+        assert not result["success"]
+        assert result["error"] == "ValueError: bad"
+
+    @pytest.mark.asyncio
+    async def test_execute_python_timeout(self):
+        tool = CodeExecutionTool(timeout=0.5)
+        context = AgentContext(session_id="test")
+
+        result = await tool.execute({"code": "import time; time.sleep(10)"}, context)
+
+        assert not result["success"]
+        assert "timed out" in result["error"]
@@ -1,10 +1,20 @@
 import pytest
 import asyncio
+import gc
+import sys
 from unittest.mock import Mock, AsyncMock
 from agten.registry import AgentRegistry
 from agten.core import Agent, Tool
 
 
+class EchoAgent(Agent):
+    async def process_message(self, message):
+        return None
+
+    async def run(self, input_message):
+        yield
+
+
 class TestAgentRegistry:
     def test_registry_initialization(self):
         registry = AgentRegistry()
@@ -72,6 +82,28 @@ class TestAgentRegistry:
         retrieved = registry.get_agent("nonexistent_id")
         assert retrieved is None
 
+    def test_agent_instances_are_strong_by_default(self):
+        registry = AgentRegistry()
+        registry.register_agent(EchoAgent)
+
+        agent_id = registry.create_agent("EchoAgent", name="echo").id
+        gc.collect()
+
+        assert registry.get_agent(agent_id) is not None
+
+    def test_agent_instances_can_be_weak(self):
+        registry = AgentRegistry(weak_instances=True)
+        registry.register_agent(EchoAgent)
+
+        agent = registry.create_agent("EchoAgent", name="echo")
+        agent_id = agent.id
+        assert registry.get_agent(agent_id) is agent
+
+        del agent
+        gc.collect()
+
+        assert registry.get_agent(agent_id) is None
+
     def test_list_agents(self):
         registry = AgentRegistry()
         registry.register_agent(SimpleChatAgent, "ChatAgent")
@@ -117,3 +149,25 @@ class TestAutoAgent(Agent):
         registry.auto_discover(str(tmp_path))
 
         assert "TestAutoAgent" in registry.list_agents()
+
+    def test_auto_discover_subpackages(self, tmp_path):
+        registry = AgentRegistry()
+
+        plugins = tmp_path / "discover_plugins"
+        (plugins / "nested").mkdir(parents=True)
+        (plugins / "nested" / "__init__.py").write_text("")
+        (plugins / "nested" / "nested_tool.py").write_text("""
+from agten.core import Tool
+
+class NestedTool(Tool):
+    async def execute(self, arguments, context):
+        return None
+
+    def _get_parameters_schema(self):
+        return {}
+""")
+
+        registry.auto_discover(str(plugins))
+
+        assert "NestedTool" in registry.list_tools()
+        assert str(tmp_path) not in sys.path
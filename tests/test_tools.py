@@ -0,0 +1,162 @@
+import pytest
+import asyncio
+from dataclasses import replace
+from agten.tools import (
+    BashTool,
+    ToolExecutor,
+    ToolConfig,
+    FileReadTool,
+    FileWriteTool,
+)
+from agten.core import Tool, AgentContext
+
+
+class SlowTool(Tool):
+    def __init__(self, delay=0.0):
+        super().__init__("slow_tool", "A tool that sleeps before answering")
+        self.delay = delay
+
+    async def execute(self, arguments, context):
+        await asyncio.sleep(self.delay)
+        return arguments.get("value")
+
+    def _get_parameters_schema(self):
+        return {"type": "object", "properties": {}}
+
+
+class TestToolExecutor:
+    @pytest.mark.asyncio
+    async def test_tool_ids_are_unique(self):
+        executor = ToolExecutor()
+        context = AgentContext(session_id="test")
+
+        calls = asyncio.gather(
+            *(
+                executor.execute_tool(SlowTool(delay=0.05), {"value": i}, context)
+                for i in range(5)
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        assert len(executor._running_tools) == 5
+        assert await calls == [0, 1, 2, 3, 4]
+        assert executor._running_tools == {}
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout(self):
+        executor = ToolExecutor(ToolConfig(timeout=0.01))
+        context = AgentContext(session_id="test")
+
+        result = await executor.execute_tool(SlowTool(delay=1.0), {}, context)
+
+        assert result.success is False
+        assert "timed out" in result.error
+        assert executor._running_tools == {}
+
+    @pytest.mark.asyncio
+    async def test_execute_many_runs_concurrently(self):
+        executor = ToolExecutor()
+        context = AgentContext(session_id="test")
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        results = await executor.execute_many(
+            [(SlowTool(delay=0.1), {"value": i}, context) for i in range(3)]
+        )
+
+        assert results == [0, 1, 2]
+        assert loop.time() - start < 0.25
+
+    def test_blocked_commands(self):
+        executor = ToolExecutor(ToolConfig(blocked_commands=["rm -rf", "Shutdown"]))
+
+        assert executor._is_blocked_command("sudo RM -RF /")
+        assert executor._is_blocked_command("shutdown now")
+        assert not executor._is_blocked_command("ls -la")
+
+        executor.config = replace(
+            executor.config, blocked_commands=(*executor.config.blocked_commands, "ls")
+        )
+
+        assert executor._is_blocked_command("ls -la")
+        assert executor.config.blocked_commands == ("rm -rf", "Shutdown", "ls")
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_tools(self):
+        executor = ToolExecutor()
+        context = AgentContext(session_id="test")
+
+        call = asyncio.create_task(
+            executor.execute_tool(SlowTool(delay=1.0), {}, context)
+        )
+        await asyncio.sleep(0.01)
+        await executor.cancel_all_tools()
+
+        result = await call
+        assert not call.cancelled()
+        assert result.success is False
+        assert result.error == "Tool execution cancelled"
+        assert executor._running_tools == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_caller_still_propagates(self):
+        executor = ToolExecutor()
+        context = AgentContext(session_id="test")
+
+        call = asyncio.create_task(
+            executor.execute_tool(SlowTool(delay=1.0), {}, context)
+        )
+        await asyncio.sleep(0.01)
+        call.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        assert executor._running_tools == {}
+
+
+class TestBashTool:
+    @pytest.mark.asyncio
+    async def test_bash_output_is_bounded(self):
+        tool = BashTool(ToolExecutor(ToolConfig(max_output_bytes=10)))
+
+        result = await tool.execute(
+            {"command": "printf 0123456789abcdef; echo oops >&2"},
+            AgentContext(session_id="test"),
+        )
+
+        assert result.success is True
+        assert result.result["stdout"] == "6789abcdef"
+        assert result.result["stderr"] == "oops\n"
+        assert result.result["stdout_truncated"] is True
+        assert result.result["stderr_truncated"] is False
+
+    def test_output_limit_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_output_bytes"):
+            ToolConfig(max_output_bytes=0)
+
+
+class TestFileReadTool:
+    @pytest.mark.asyncio
+    async def test_read_file(self, tmp_path):
+        path = tmp_path / "notes.txt"
+        path.write_bytes("caf\u00e9\r\nline two\n".encode("utf-8"))
+
+        result = await FileReadTool().execute(
+            {"path": str(path)}, AgentContext(session_id="test")
+        )
+
+        assert result["content"] == "caf\u00e9\nline two\n"
+        assert result["size"] == len(result["content"])
+
+
+class TestFileWriteTool:
+    @pytest.mark.asyncio
+    async def test_write_file(self, tmp_path):
+        path = tmp_path / "out.txt"
+
+        result = await FileWriteTool().execute(
+            {"path": str(path), "content": "hello"}, AgentContext(session_id="test")
+        )
+
+        assert result == {"path": str(path), "size": 5, "success": True}
+        assert path.read_text(encoding="utf-8") == "hello"